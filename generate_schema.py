@@ -0,0 +1,77 @@
+"""Generate src/_schema_data.py from src/input.schema.json.
+
+input.schema.json remains the schema's source of truth.  The generated module
+holds the same schema as a python literal so that it is loaded by import
+rather than read and parsed as json at runtime.  Run this script after
+changing the schema.
+"""
+import json
+import pathlib
+import textwrap
+import typing
+
+SRC_PATH = pathlib.Path(__file__).parent / "src"
+SCHEMA_PATH = SRC_PATH / "input.schema.json"
+SCHEMA_DATA_PATH = SRC_PATH / "_schema_data.py"
+
+HEADER = '''"""Input schema as a python literal.
+
+Generated from input.schema.json by generate_schema.py.  Do not edit.
+"""
+import typing
+
+SCHEMA: dict[str, typing.Any]
+'''
+
+MAX_LINE_LENGTH = 79
+INDENT = "    "
+
+
+def format_value(value: typing.Any, depth: int, column: int) -> str:
+    """Format a json value as a python literal.
+
+    depth is the nesting depth of the value, and column is the column at which
+    formatting starts.  Containers are written one item per line and strings
+    too long for the line are split into implicitly concatenated pieces.
+    """
+    pad = INDENT * depth
+    if isinstance(value, dict):
+        items = ["{}{}{!r}: {},\n".format(
+            pad, INDENT, k,
+            format_value(v, depth + 1, len(pad + INDENT + repr(k) + ": ")))
+            for k, v in value.items()]
+        return "{\n" + "".join(items) + pad + "}"
+    if isinstance(value, list):
+        items = ["{}{}{},\n".format(
+            pad, INDENT, format_value(v, depth + 1, len(pad + INDENT)))
+            for v in value]
+        return "[\n" + "".join(items) + pad + "]"
+    literal = repr(value)
+    # leave room for the trailing comma
+    if not isinstance(value, str) or column + len(literal) < MAX_LINE_LENGTH:
+        return literal
+    width = MAX_LINE_LENGTH - len(pad + INDENT) - len("''")
+    # keep whitespace as is so that the pieces concatenate to the value
+    pieces = textwrap.wrap(
+        value, width=width, expand_tabs=False, replace_whitespace=False,
+        drop_whitespace=False)
+    lines = "".join(
+        "{}{}{!r}\n".format(pad, INDENT, piece) for piece in pieces)
+    return "(\n" + lines + pad + ")"
+
+
+def generate() -> str:
+    """Return the source of the schema data module."""
+    schema = json.loads(SCHEMA_PATH.read_text())
+    return HEADER + "SCHEMA = " + format_value(schema, 0, 0) + "\n"
+
+
+def main() -> None:
+    """Write the schema data module."""
+    SCHEMA_DATA_PATH.write_text(generate())
+    print("wrote {}".format(SCHEMA_DATA_PATH))
+
+
+if __name__ == "__main__":
+    """Run the main function as a script."""
+    main()
@@ -7,18 +7,24 @@ import typing
 def main() -> None:
     """Run all linters.
 
-    Linter output will be sent to stdout.
+    Linters are independent of each other so they are all started up front
+    and run concurrently.  Linter output will be sent to stdout.
     This function will exit the script with return code 0 on success, and other
     value on failure.
     """
+    linter_inputs: typing.List[typing.List[str]] = [
+        ['flake8', '--max-complexity', '8', '.'],
+        ['mypy', '--strict', '.'],
+        ['pydocstyle', '.'],
+        ['autopep8', '-r', '-d', '-a', '-a', '--exit-code', '.'],
+    ]
+    procs = [subprocess.Popen(args, stdout=subprocess.PIPE,
+                              stderr=subprocess.STDOUT, text=True)
+             for args in linter_inputs]
+
     is_success: bool = True
-    for linter_input in [
-            ['flake8', '--max-complexity', '8', '.'],
-            ['mypy', '--strict', '.'],
-            ['pydocstyle', '.'],
-            ['autopep8', '-r', '-d', '-a', '-a', '--exit-code', '.']
-    ]:
-        this_success = run_single_linter(linter_input)
+    for args, p in zip(linter_inputs, procs):
+        this_success = wait_single_linter(args, p)
         is_success = is_success and this_success
 
     if is_success:
@@ -29,13 +35,17 @@ def main() -> None:
         sys.exit(-1)
 
 
-def run_single_linter(args: typing.List[str]) -> bool:
-    """Return true if the linter passes, and false if it fails."""
-    p = subprocess.run(args, stdout=subprocess.PIPE,
-                       stderr=subprocess.STDOUT, text=True)
+def wait_single_linter(
+        args: typing.List[str],
+        p: 'subprocess.Popen[str]') -> bool:
+    """Wait for a started linter.
+
+    Return true if the linter passes, and false if it fails.
+    """
+    stdout, _ = p.communicate()
     if p.returncode != 0:
         print("{} failure:".format(args[0]))
-        print(p.stdout)
+        print(stdout)
         return False
     else:
         print("{} success".format(args[0]))
@@ -13,7 +13,7 @@ def main() -> None:
                         '--cov-report=term-missing',
                         '.'],
                        stdout=subprocess.PIPE,
-                       stderr=subprocess.PIPE,
+                       stderr=subprocess.STDOUT,
                        text=True)
     print(p.stdout)
     if p.returncode != 0:
@@ -9,12 +9,12 @@ _original_default = json.JSONEncoder().default
 
 
 def _default(self: json.JSONEncoder, o: typing.Any) -> typing.Any:
-    try:
-        f = getattr(o.__class__, "json_default")
-    except AttributeError:
+    # look up with a default rather than catching AttributeError so that no
+    # exception is raised and caught for each object without json_default
+    f = getattr(type(o), "json_default", None)
+    if f is None:
         return _original_default(o)
-    else:
-        return f(o)
+    return f(o)
 
 
 # ignore typing.  mypy doesn't like assigning a function/method,
@@ -1,11 +1,12 @@
 """Define and operate on graph objects."""
 import abc
+import array
 import collections
 import collections.abc
-import functools
+import heapq
+import itertools
 import json
 import logging
-import queue
 import typing
 
 # each module/file should provide a global-level logger using this statement
@@ -22,13 +23,11 @@ Vertex = collections.abc.Hashable
 GraphDistance = int
 
 
-# ordering is done by distance, allowing paths to be added to a priority queue.
-# mypy current complains that total_ordering must be used on a concrete type.
-# https://github.com/python/mypy/issues/8539 agrees this is a bug
-@functools.total_ordering  # type: ignore
 class _Path(abc.ABC):
     """A generic path between 2 vertices."""
 
+    __slots__ = ()
+
     @abc.abstractmethod
     def get_source_vertex(self) -> Vertex:
         """Return the source vertex."""
@@ -54,26 +53,15 @@ class _Path(abc.ABC):
         The initial vertex is excluded.
         """
 
-    def _is_valid_operand(self, other: typing.Any) -> bool:
-        return isinstance(other, _Path)
-
-    def __eq__(self, other: typing.Any) -> bool:
-        """Define equals according to path distance."""
-        if not self._is_valid_operand(other):
-            return NotImplemented
-        # mypy isn't doing well with NotImplemented's type
-        return self.get_distance() == other.get_distance()  # type: ignore
 
-    def __lt__(self, other: typing.Any) -> bool:
-        """Define < according to path distance."""
-        if not self._is_valid_operand(other):
-            return NotImplemented
-        # mypy isn't doing well with NotImplemented's type
-        return self.get_distance() < other.get_distance()  # type: ignore
+class _PathRef(object):
+    """Holds a ref to a path so that it may be reassigned.
 
+    Paths in this module read _path directly rather than calling get() as
+    refs are dereferenced on every step of path construction and expansion.
+    """
 
-class _PathRef(object):
-    """Holds a ref to a path so that it may be reassigned."""
+    __slots__ = ('_path',)
 
     _path: _Path
 
@@ -89,10 +77,6 @@ class _PathRef(object):
         """Set the ref value."""
         self._path = path
 
-    def copy(self) -> '_PathRef':
-        """Copy (shallow) the PathRef."""
-        return _PathRef(self.get())
-
     def json_default(self) -> typing.Any:
         """Represent as json."""
         return {"path_ref": self._path}
@@ -110,6 +94,8 @@ class Edge(_Path):
     Vertices must be constructed first and passed as the arguments of edges.
     """
 
+    __slots__ = ('_source_vertex', '_destination_vertex', '_distance')
+
     _source_vertex: Vertex
     _destination_vertex: Vertex
     _distance: GraphDistance
@@ -164,33 +150,40 @@ class Edge(_Path):
 
     def __str__(self) -> str:
         """Represent as a string."""
-        return json.dumps(self)
+        return json.dumps(self.json_default())
 
 
 class _PathSequence(_Path):
     """A sequence of Path and additional Edge forming a new Path."""
 
+    __slots__ = ('_base_path_ref', '_added_edge', '_distance', '_expanded')
+
     _base_path_ref: _PathRef
     _added_edge: Edge
     # store this so that a long string of sequences doesn't have linear
     # get_distance time
     _distance: GraphDistance
+    # lazily computed on the first expand().  Holds the first path in the
+    # chain that is not a sequence and the vertices of all added edges
+    # following it, so that expanding doesn't nest a generator per sequence.
+    _expanded: typing.Optional[tuple[_Path, list[Vertex]]]
 
     def __init__(
             self,
             base_path_ref: _PathRef,
             added_edge: Edge) -> None:
         """Create the sequence."""
-        assert (base_path_ref.get().get_destination_vertex() ==
-                added_edge.get_source_vertex())
+        base_path = base_path_ref._path
+        assert (base_path.get_destination_vertex() ==
+                added_edge._source_vertex)
         self._base_path_ref = base_path_ref
         self._added_edge = added_edge
-        self._distance = (base_path_ref.get().get_distance() +
-                          added_edge.get_distance())
+        self._distance = base_path.get_distance() + added_edge._distance
+        self._expanded = None
 
     def get_source_vertex(self) -> Vertex:
         """Return the source vertex."""
-        return self._base_path_ref.get().get_source_vertex()
+        return self._base_path_ref._path.get_source_vertex()
 
     def get_destination_vertex(self) -> Vertex:
         """Return the destination vertex."""
@@ -205,14 +198,26 @@ class _PathSequence(_Path):
         """Return the distinct represented paths.
 
         Excludes the first vertex.
+        The chain of sequences is walked only on the first call.  Paths must
+        not be expanded until the graph has finished calculating them.
         """
+        if self._expanded is None:
+            added_vertices: list[Vertex] = []
+            path: _Path = self
+            while isinstance(path, _PathSequence):
+                added_vertices.append(path._added_edge._destination_vertex)
+                path = path._base_path_ref._path
+            added_vertices.reverse()
+            self._expanded = (path, added_vertices,)
+        (base_path, added_vertices,) = self._expanded
+
         def path_yielder(g: collections.abc.Generator[Vertex, None, None]) -> (
                 collections.abc.Generator[Vertex, None, None]):
             yield from g
-            yield self._added_edge.get_destination_vertex()
+            yield from added_vertices
             return
 
-        for g in self._base_path_ref.get().expand():
+        for g in base_path.expand():
             yield path_yielder(g)
         return
 
@@ -227,12 +232,14 @@ class _PathSequence(_Path):
 
     def __str__(self) -> str:
         """Represent as a string."""
-        return json.dumps(self)
+        return json.dumps(self.json_default())
 
 
 class _PathAlternatives(_Path):
     """Two paths of equal distance between the same 2 vertices."""
 
+    __slots__ = ('_path1', '_path2')
+
     _path1: _PathRef
     _path2: _PathRef
 
@@ -252,15 +259,15 @@ class _PathAlternatives(_Path):
 
     def get_source_vertex(self) -> Vertex:
         """Return the source vertex."""
-        return self._path1.get().get_source_vertex()
+        return self._path1._path.get_source_vertex()
 
     def get_destination_vertex(self) -> Vertex:
         """Return the destination vertex."""
-        return self._path1.get().get_destination_vertex()
+        return self._path1._path.get_destination_vertex()
 
     def get_distance(self) -> GraphDistance:
         """Return the distance between the vertices."""
-        return self._path1.get().get_distance()
+        return self._path1._path.get_distance()
 
     def expand(self) -> collections.abc.Generator[
             collections.abc.Generator[Vertex, None, None], None, None]:
@@ -268,8 +275,8 @@ class _PathAlternatives(_Path):
 
         Excludes the first vertex.
         """
-        yield from self._path1.get().expand()
-        yield from self._path2.get().expand()
+        yield from self._path1._path.expand()
+        yield from self._path2._path.expand()
         return
 
     def json_default(self) -> typing.Any:
@@ -282,107 +289,184 @@ class _PathAlternatives(_Path):
 
     def __str__(self) -> str:
         """Represent as a string."""
-        return json.dumps(self)
+        return json.dumps(self.json_default())
+
+
+def _find_duplicate(
+        items: collections.abc.Iterable[collections.abc.Hashable]) -> (
+            collections.abc.Hashable):
+    """Return an item occurring more than once.  One must exist."""
+    return next(item for (item, count,) in collections.Counter(items).items()
+                if count > 1)
+
+
+def _set_alternatives(
+        shortest_paths: list[typing.Optional[_PathRef]],
+        alternatives: dict[int, list[_Path]]) -> None:
+    """Combine each shortest path with its equal distance alternatives.
+
+    Paths are replaced through their refs so that paths already built on top
+    of them include the alternatives as well.
+    """
+    for (vertex, vertex_alternatives,) in alternatives.items():
+        path_ref = shortest_paths[vertex]
+        assert path_ref is not None
+        path = path_ref._path
+        for alternative in vertex_alternatives:
+            path = _PathAlternatives(_PathRef(path), _PathRef(alternative))
+        logger.debug("replacing path with alternatives: %s", path)
+        path_ref.set(path)
 
 
 class Graph(object):
-    """Represent a graph."""
+    """Represent a graph.
+
+    Outgoing edges are stored in compressed sparse row form: the edges
+    leaving the vertex at index i are at indices
+    [_row_ptr[i], _row_ptr[i + 1]) of _csr_edges, with the destination
+    vertex indices and distances of those edges held in flat parallel
+    arrays.
+    """
 
     _vertices: list[Vertex]
     _edges: list[Edge]
-    _vertices_outgoing_edges: dict[Vertex, list[Edge]]
-    _vertices_set: set[Vertex]
+    _vertex_indices: dict[Vertex, int]
+    _row_ptr: 'array.array[int]'
+    _csr_edges: list[Edge]
+    _csr_destinations: 'array.array[int]'
+    _csr_distances: 'array.array[int]'
 
     def __init__(self, vertices: list[Vertex], edges: list[Edge]) -> None:
         """Create a graph from lists of vertices and edges."""
         self._vertices = vertices
         self._edges = edges
 
-        # assert no duplicate vertex label
-        self._vertices_set = set()
-        for v in self._vertices:
-            assert v not in self._vertices_set, "duplicate label: {}".format(v)
-            self._vertices_set.add(v)
-
-        # assert no duplicate edge
-        edge_tuples = set()
-        for e in self._edges:
-            tup = (
-                e.get_source_vertex(),
-                e.get_destination_vertex(),)
-            assert tup not in edge_tuples, "duplicate edge: {}".format(tup)
-            edge_tuples.add(tup)
-
-        # assemble the dict of vertex labels to edges
-        self._vertices_outgoing_edges = collections.defaultdict(list)
+        # assert no duplicate vertex label.  The dict is built in a single
+        # call and only searched for the duplicate, to report it, when one
+        # exists
+        self._vertex_indices = {v: i for (i, v,) in enumerate(self._vertices)}
+        assert len(self._vertex_indices) == len(self._vertices), (
+            "duplicate label: {}".format(_find_duplicate(self._vertices)))
+
+        # in a single pass over the edges assert no edge to an unknown vertex,
+        # collect the edges to check for duplicates, and assemble the outgoing
+        # edges of each vertex in vertex index order
+        edge_set: set[tuple[Vertex, Vertex]] = set()
+        add_edge = edge_set.add
+        outgoing_edges: list[list[Edge]] = [[] for _ in self._vertices]
         for e in self._edges:
-            self._vertices_outgoing_edges[e.get_source_vertex()].append(e)
-        logger.debug("calculated outgoing edges of all vertices: {}".format(
-            self._vertices_outgoing_edges))
+            tup = (e._source_vertex, e._destination_vertex,)
+            source_index = self._vertex_indices.get(tup[0])
+            assert (source_index is not None and
+                    tup[1] in self._vertex_indices), (
+                "edge of unknown vertex: {}".format(tup))
+            add_edge(tup)
+            outgoing_edges[source_index].append(e)
+        # the edges are only searched for the duplicate when one exists
+        assert len(edge_set) == len(self._edges), (
+            "duplicate edge: {}".format(_find_duplicate(
+                (e._source_vertex, e._destination_vertex,)
+                for e in self._edges)))
+
+        self._row_ptr = array.array('q', [0])
+        self._csr_edges = []
+        for vertex_edges in outgoing_edges:
+            self._csr_edges.extend(vertex_edges)
+            self._row_ptr.append(len(self._csr_edges))
+        self._csr_destinations = array.array('q', [
+            self._vertex_indices[e._destination_vertex]
+            for e in self._csr_edges])
+        self._csr_distances = array.array('q', [
+            e._distance for e in self._csr_edges])
+        logger.debug("calculated outgoing edges of all vertices: %s",
+                     self._csr_edges)
 
     def calculate_shortest_paths(self, start: Vertex) -> dict[Vertex, _Path]:
         """Calculate shortest paths from vertex "start" to all others."""
-        logger.info("calculating shortest paths from vertex: {}".format(start))
-        assert start in self._vertices, (
+        logger.info("calculating shortest paths from vertex: %s", start)
+        assert start in self._vertex_indices, (
             "unexpected vertex: {}".format(start))
-
-        shortest_paths: dict[Vertex, _PathRef] = {}
-        next_path_by_distance: queue.PriorityQueue[_Path] = (
-            queue.PriorityQueue())
+        start_index = self._vertex_indices[start]
+
+        # shortest paths and their distances are indexed by vertex index.  A
+        # vertex's distance is only meaningful once it has a shortest path.
+        shortest_paths: list[typing.Optional[_PathRef]] = (
+            [None] * len(self._vertices))
+        shortest_distances = array.array('q', [0]) * len(self._vertices)
+        # heap of (distance, tiebreaker, destination vertex index, path).
+        # The tiebreaker keeps equal distance entries in insertion order and
+        # guarantees that paths are never compared against each other.  The
+        # distance and destination are carried in the entry so that popping
+        # requires no accessor calls on the path.
+        next_path_by_distance: list[
+            tuple[GraphDistance, int, int, _Path]] = []
+        # equal distance alternatives to each vertex's shortest path.  These
+        # are combined into _PathAlternatives once all paths are found.
+        alternatives: collections.defaultdict[int, list[_Path]] = (
+            collections.defaultdict(list))
+        counter = itertools.count()
+        row_ptr = self._row_ptr
+        csr_edges = self._csr_edges
+        csr_destinations = self._csr_destinations
+        csr_distances = self._csr_distances
 
         # add all vertices connected to the start vertex to "next" queue
-        for e in self._vertices_outgoing_edges.get(start, []):
-            logger.debug("adding initial edge: {}".format(e))
-            next_path_by_distance.put(e)
+        for i in range(row_ptr[start_index], row_ptr[start_index + 1]):
+            logger.debug("adding initial edge: %s", csr_edges[i])
+            heapq.heappush(
+                next_path_by_distance,
+                (csr_distances[i], next(counter), csr_destinations[i],
+                 csr_edges[i]))
 
         # implicit shortest path to starting node is 0
-        shortest_paths[start] = _PathRef(Edge(start, start, 0))
+        shortest_paths[start_index] = _PathRef(Edge(start, start, 0))
+        shortest_distances[start_index] = 0
 
         # pop the next path.  If we've never seen the destination vertex it
         # is a shortest path so add a result and add its edges to next
         # vertices.  If we have seen it check to see if this is an alternate
         # shortest path to the vertex, but then add no next vertex.  Do this
         # until there is no more work (no more items in queue).
-        while not next_path_by_distance.empty():
-            next_path = next_path_by_distance.get_nowait()
-            vertex = next_path.get_destination_vertex()
-            logger.debug("popped next path: {}.  shortest paths: {}".format(
-                next_path, shortest_paths))
-            if vertex in shortest_paths:
-                logger.debug("vertex in shortest paths")
-                existing_path_ref = shortest_paths[vertex]
-                existing_path = existing_path_ref.get()
-                assert existing_path.get_distance() <= next_path.get_distance()
-                if existing_path.get_distance() == next_path.get_distance():
-                    logger.debug("new alternative path")
-                    # we have an alternate shortest path to this vertex
-                    new_alternatives = _PathAlternatives(
-                        existing_path_ref.copy(), _PathRef(next_path))
-                    logger.debug(
-                        ("replacing path with alternatives.  "
-                         "Original path: {}.  New alternatives: {}").format(
-                            existing_path,
-                            next_path
-                        ))
-                    existing_path_ref.set(new_alternatives)
-                else:
-                    logger.debug("this is a longer path than exists")
-                # do not add any new paths to search
-            else:
+        while next_path_by_distance:
+            distance, _, vertex, next_path = heapq.heappop(
+                next_path_by_distance)
+            logger.debug("popped next path: %s", next_path)
+            existing_path_ref = shortest_paths[vertex]
+            if existing_path_ref is None:
                 # a new shortest path!
                 logger.debug("vertex NOT in shortest paths")
                 path_ref = _PathRef(next_path)
                 shortest_paths[vertex] = path_ref
+                shortest_distances[vertex] = distance
                 # add all outgoing edges to next paths.
-                for e in self._vertices_outgoing_edges[vertex]:
+                for i in range(row_ptr[vertex], row_ptr[vertex + 1]):
                     new_path = _PathSequence(
                         path_ref,
-                        e)
-                    logger.debug("adding additional path: {}".format(new_path))
-                    next_path_by_distance.put_nowait(new_path)
+                        csr_edges[i])
+                    logger.debug("adding additional path: %s", new_path)
+                    heapq.heappush(
+                        next_path_by_distance,
+                        (distance + csr_distances[i], next(counter),
+                         csr_destinations[i], new_path))
+                continue
+
+            # do not add any new paths to search
+            shortest_distance = shortest_distances[vertex]
+            if shortest_distance == distance:
+                # we have an alternate shortest path to this vertex
+                logger.debug("new alternative path")
+                alternatives[vertex].append(next_path)
+            else:
+                # paths are popped in order of distance, so any path that
+                # isn't the first or an alternative is longer
+                logger.debug("this is a longer path than exists")
+                assert shortest_distance < distance
+
+        _set_alternatives(shortest_paths, alternatives)
 
-        # unpack the path refs to return
+        # unpack the path refs of the reached vertices to return
         ret: dict[Vertex, _Path] = {}
-        for (k, v,) in shortest_paths.items():
-            ret[k] = v.get()
+        for (k, v,) in zip(self._vertices, shortest_paths):
+            if v is not None:
+                ret[k] = v.get()
         return ret
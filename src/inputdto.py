@@ -7,15 +7,53 @@ They are intended solely to convey data and contain little or
 no public logic.
 """
 
-import json
-import jsonschema  # type: ignore
+import fastjsonschema  # type: ignore
+import functools
 import logging
-import pathlib
+import orjson
 import typing
 
+from . import _schema_data
+
 # each module/file should provide a global-level logger using this statement
 logger = logging.getLogger(__name__)
 
+# the schema's validators are constructed once so that each construct() call
+# only pays for validation itself.  The schema is imported from a module
+# generated from input.schema.json (see generate_schema.py) rather than read
+# and parsed at import.
+# fastjsonschema compiles the schema into a specialized function and is used
+# to accept valid input.  jsonschema is only used to report errors.
+_SCHEMA = _schema_data.SCHEMA
+_FAST_VALIDATE = fastjsonschema.compile(_SCHEMA)
+
+
+@functools.lru_cache(maxsize=None)
+def _get_validator() -> typing.Any:
+    """Return the jsonschema validator for the schema.
+
+    jsonschema is slow to import and only needed to report errors, so it is
+    imported and the validator constructed the first time this is called.
+    """
+    import jsonschema.validators  # type: ignore
+    validator_class = jsonschema.validators.validator_for(_SCHEMA)
+    # check the schema itself once, as jsonschema.validate would on every call
+    validator_class.check_schema(_SCHEMA)
+    return validator_class(_SCHEMA)
+
+
+def _json_default(o: typing.Any) -> typing.Any:
+    return o.json_default()
+
+
+def _dumps(o: typing.Any) -> str:
+    """Serialize DTOs to a json string.
+
+    orjson does not use the json_default monkey patch in __init__.py, so
+    json_default is passed as its default explicitly.
+    """
+    return orjson.dumps(o, default=_json_default).decode()
+
 
 class CharacterDTO(object):
     """
@@ -29,6 +67,8 @@ class CharacterDTO(object):
     "y" : number -- y coordinate
     """
 
+    __slots__ = ('name', 'initiative', 'initiative2', 'x', 'y')
+
     name: str
     initiative: int
     initiative2: int
@@ -40,13 +80,12 @@ class CharacterDTO(object):
         self.name = dct['name']
         self.initiative = dct['initiative']
         self.initiative2 = dct['initiative2']
-        if self.initiative2 < self.initiative:
-            raise ValueError(
-                ("initiative must be less than or "
-                 "equal to initiative2: {} {}").format(
-                    self.initiative, self.initiative2))
         self.x = dct['x']
         self.y = dct['y']
+        if self.initiative2 < self.initiative:
+            raise ValueError(
+                "initiative must be less than or "
+                f"equal to initiative2: {self.initiative} {self.initiative2}")
 
     def json_default(self) -> typing.Any:
         """Override json serialization via __init__.py monkey patch."""
@@ -60,7 +99,7 @@ class CharacterDTO(object):
 
     def __str__(self) -> str:
         """Return a string for the object."""
-        return json.dumps(self)
+        return _dumps(self)
 
 
 class MonsterDTO(object):
@@ -75,6 +114,8 @@ class MonsterDTO(object):
     "y" : number -- y coordinate
     """
 
+    __slots__ = ('name', 'number', 'initiative', 'x', 'y')
+
     name: str
     number: int
     initiative: int
@@ -101,7 +142,7 @@ class MonsterDTO(object):
 
     def __str__(self) -> str:
         """Return a string for the object."""
-        return json.dumps(self)
+        return _dumps(self)
 
 
 class InputDTO(object):
@@ -115,8 +156,7 @@ class InputDTO(object):
     "mm_num" : number -- moving monster placard number
     """
 
-    # raw parsed json for reference
-    _dct: dict[str, object]
+    __slots__ = ('characters', 'monsters', 'mm_name', 'mm_num')
 
     # component data
     characters: list[CharacterDTO]
@@ -125,60 +165,57 @@ class InputDTO(object):
     mm_num: int
 
     def __init__(self, dct: dict[str, typing.Any]) -> None:
-        """Validate and construct Input."""
-        self._dct = dct
+        """Validate and construct Input.
+
+        Characters must have unique names, monsters unique (name, number),
+        and no 2 character or monster may occupy the same hex.  These are
+        checked while constructing each DTO, stopping at the first
+        duplicate.
+        """
+        # locations are keyed by (x, y).  The schema accepts integral floats
+        # such as 1.0 as integers, which compare and hash equal to the int so
+        # that 1.0 and 1 share a hex
+        character_names: set[str] = set()
+        monster_labels: set[tuple[str, int]] = set()
+        location_to_object: dict[
+            tuple[int, int],
+            typing.Union[CharacterDTO, MonsterDTO]] = {}
 
+        # the lists are built by a bound append rather than a comprehension so
+        # that each DTO is checked as it is constructed
         self.characters = []
-        for c in dct["characters"]:
-            self.characters.append(CharacterDTO(c))
+        append_character = self.characters.append
+        for c_dct in dct["characters"]:
+            c = CharacterDTO(c_dct)
+            if c.name in character_names:
+                raise ValueError(f"duplicate character name: {c.name}")
+            character_names.add(c.name)
+            location: tuple[int, int] = (c.x, c.y,)
+            if location in location_to_object:
+                raise ValueError(
+                    "two objects occupy the same hex: "
+                    f"{location_to_object[location]}, {c}")
+            location_to_object[location] = c
+            append_character(c)
 
         self.monsters = []
-        for m in dct["monsters"]:
-            self.monsters.append(MonsterDTO(m))
-
-        self.mm_name = dct["mm_name"]
-        self.mm_num = dct["mm_num"]
-
-        # perform value validation
-        self._assert_unique_character_names()
-        self._assert_unique_monster_labels()
-        self._assert_distinct_object_locations()
-
-    def _assert_unique_character_names(self) -> None:
-        """Assert all characters have unique names."""
-        character_names: set[str] = set()
-        for c in self.characters:
-            name: str = c.name
-            if name in character_names:
-                raise ValueError("duplicate character name: {}".format(name))
-            character_names.add(name)
-
-    def _assert_unique_monster_labels(self) -> None:
-        """Assert all monsters have unique (name, number)."""
-        monster_labels: set[tuple[str, int]] = set()
-        for m in self.monsters:
-            monster_name: str = m.name
-            number: int = m.number
-            label: tuple[str, int] = (monster_name, number,)
+        append_monster = self.monsters.append
+        for m_dct in dct["monsters"]:
+            m = MonsterDTO(m_dct)
+            label: tuple[str, int] = (m.name, m.number,)
             if label in monster_labels:
-                raise ValueError("duplicate monster label: {}".format(label))
+                raise ValueError(f"duplicate monster label: {label}")
             monster_labels.add(label)
-
-    def _assert_distinct_object_locations(self) -> None:
-        """Assert that no 2 character or monster occupy the same hex."""
-        location_to_object: dict[
-            tuple[int, int],
-            typing.Union[CharacterDTO, MonsterDTO]] = {}
-        objects: list[typing.Union[CharacterDTO, MonsterDTO]] = []
-        objects.extend(self.characters)
-        objects.extend(self.monsters)
-        for obj in objects:
-            location: tuple[int, int] = (obj.x, obj.y,)
+            location = (m.x, m.y,)
             if location in location_to_object:
                 raise ValueError(
-                    "two objects occupy the same hex: {}, {}".format(
-                        location_to_object[location], obj))
-            location_to_object[location] = obj
+                    "two objects occupy the same hex: "
+                    f"{location_to_object[location]}, {m}")
+            location_to_object[location] = m
+            append_monster(m)
+
+        self.mm_name = dct["mm_name"]
+        self.mm_num = dct["mm_num"]
 
     def json_default(self) -> typing.Any:
         """Override json serialization via __init__.py monkey patch."""
@@ -191,34 +228,42 @@ class InputDTO(object):
 
     def __str__(self) -> str:
         """Return a string for the object."""
-        return json.dumps(self)
+        return _dumps(self)
+
 
+def decode(input_str: typing.Union[str, bytes]) -> InputDTO:
+    """Decode the input or raise an exception.
 
-def decode(input_str: str) -> InputDTO:
-    """Decode the input or raise an exception."""
+    Invalid json raises json.JSONDecodeError.  Input is parsed by orjson,
+    which unlike the json module rejects NaN and Infinity and numbers too
+    large for a double, and parses integers beyond 64 bits as floats.  The
+    schema bounds every integer field well within 64 bits so that such
+    integers are rejected by validation.
+    """
     logger.debug("starting input decode. input: %s", input_str)
-    # parse the json
-    dct: dict[str, typing.Any] = json.loads(input_str)
-    logger.debug("loaded json")
+    # parse the json.  orjson's decode error is a json.JSONDecodeError
+    dct: dict[str, typing.Any] = orjson.loads(input_str)
     return construct(dct)
 
 
 def construct(input_dict: dict[str, typing.Any]) -> InputDTO:
     """Construct the input objects, validating along the way."""
-    # load the schema
-    logger.debug("loading input.schema.json")
-    path = pathlib.Path(__file__).parent / "input.schema.json"
-    with path.open() as f:
-        schema_text = f.read()
-    schema = json.loads(schema_text)
-
     # validate with schema
-    logger.debug("validating input with schema")
-    jsonschema.validate(input_dict, schema)
-    logger.debug("input validated with schema")
+    try:
+        _FAST_VALIDATE(input_dict)
+    except fastjsonschema.JsonSchemaException as e:
+        # raise the same (best matching) error that jsonschema.validate would.
+        # Both validators use the draft pinned by the schema's $schema, but
+        # should jsonschema still accept the input it is rejected with
+        # fastjsonschema's error rather than constructed
+        import jsonschema.exceptions  # type: ignore
+        error = jsonschema.exceptions.best_match(
+            _get_validator().iter_errors(input_dict))
+        if error is None:
+            error = jsonschema.exceptions.ValidationError(str(e))
+        raise error from None
 
     # construct the input object.  Performs additional validation
-    logger.debug("constructing input DTOs")
     dto = InputDTO(input_dict)
     logger.debug("constructed final DTO: %s", dto)
     return dto
@@ -1,4 +1,5 @@
 import collections.abc
+import json
 import pytest
 import src.graph
 
@@ -10,27 +11,17 @@ def _bidirectional_edge(
     return [src.graph.Edge(v1, v2, weight), src.graph.Edge(v2, v1, weight)]
 
 
-class _NotEdge(object):
-    """This class is not an edge and cannot be compared against an edge."""
+def test_invalid_graph() -> None:
+    with pytest.raises(AssertionError, match="duplicate label: 2"):
+        src.graph.Graph(["1", "2", "3", "2"], [])
 
+    with pytest.raises(AssertionError, match="duplicate edge: \\('1', '2'\\)"):
+        src.graph.Graph(
+            ["1", "2"],
+            [src.graph.Edge("1", "2", 1), src.graph.Edge("1", "2", 2)])
 
-def test_path_comparison() -> None:
-    e1 = src.graph.Edge("1", "2", 1)
-    e2 = src.graph.Edge("3", "4", 2)
-    e3 = src.graph.Edge("5", "6", 1)
-
-    assert e1 == e1
-    assert e1 < e2
-    assert e2 > e1
-    assert e1 <= e2
-    assert e2 >= e1
-    assert e1 != e2
-    assert e1 == e3
-
-    not_edge = _NotEdge()
-    assert e1 != not_edge
-    with pytest.raises(TypeError, match="'<=' not supported"):
-        assert not e1 <= not_edge
+    with pytest.raises(AssertionError, match="edge of unknown vertex"):
+        src.graph.Graph(["1", "2"], [src.graph.Edge("1", "3", 1)])
 
 
 def _assert_expand(
@@ -47,7 +38,7 @@ def _assert_expand(
     assert not s
 
 
-def test_paths() -> None:
+def _example_graph() -> src.graph.Graph:
     # construct a graph:
     # 1 (10) -> 2 (20) -> 3
     # 1 (30) -> 3
@@ -66,7 +57,11 @@ def test_paths() -> None:
         _bidirectional_edge("5", "3", 20) +
         _bidirectional_edge("3", "6", 10)
     )
+    return graph
 
+
+def test_paths() -> None:
+    graph = _example_graph()
     shortest_paths = graph.calculate_shortest_paths("1")
     assert shortest_paths["1"].get_distance() == 0
     assert shortest_paths["2"].get_distance() == 10
@@ -91,3 +86,28 @@ def test_paths() -> None:
         ["2", "3", "6", ],
         ["4", "3", "6", ],
     ])
+
+
+def test_str() -> None:
+    shortest_paths = _example_graph().calculate_shortest_paths("1")
+    # an edge, alternatives, and a sequence following alternatives
+    for v in ["2", "3", "6"]:
+        s = str(shortest_paths[v])
+        # make sure it is valid json
+        json.loads(s)
+
+
+def test_long_path() -> None:
+    # construct a line graph: 0 (1) -> 1 (1) -> 2 ... -> 99
+    num_vertices = 100
+    vertices: list[src.graph.Vertex] = list(range(num_vertices))
+    graph = src.graph.Graph(
+        vertices,
+        [src.graph.Edge(v, v + 1, 1) for v in range(num_vertices - 1)])
+
+    shortest_paths = graph.calculate_shortest_paths(0)
+    last = shortest_paths[num_vertices - 1]
+    assert last.get_distance() == num_vertices - 1
+    _assert_expand(last.expand(), [vertices[1:]])
+    # expanding again reuses the cached chain
+    _assert_expand(last.expand(), [vertices[1:]])
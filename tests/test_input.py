@@ -1,7 +1,9 @@
+import generate_schema
 import json
 
 import jsonschema  # type: ignore
 import pytest
+import src._schema_data
 import src.inputdto
 import typing
 
@@ -33,6 +35,13 @@ def test_input_failures() -> None:
     with pytest.raises(json.JSONDecodeError):
         src.inputdto.decode('asdf')
 
+    # orjson rejects NaN and numbers too large for a double
+    s = json.dumps(_simple_valid_json_dict())
+    with pytest.raises(json.JSONDecodeError):
+        src.inputdto.decode(s.replace('"mm_num": 1', '"mm_num": NaN'))
+    with pytest.raises(json.JSONDecodeError):
+        src.inputdto.decode(s.replace('"mm_num": 1', '"mm_num": 1e400'))
+
     # not a json object
     with pytest.raises(
             jsonschema.ValidationError,
@@ -128,6 +137,42 @@ def test_input_failures() -> None:
         src.inputdto.decode(json.dumps(d))
     assert excinfo.value.json_path == "$.monsters"
 
+    # orjson parses integers beyond 64 bits as floats, which fail the bound
+    d = _simple_valid_json_dict()
+    d["mm_num"] = 10**20
+    with pytest.raises(
+            jsonschema.ValidationError,
+            match="1e\\+20 is greater than the maximum of 10") as excinfo:
+        src.inputdto.decode(json.dumps(d))
+    assert excinfo.value.json_path == "$.mm_num"
+
+    d = _simple_valid_json_dict()
+    d["monsters"][0]["x"] = 2**31
+    with pytest.raises(
+            jsonschema.ValidationError,
+            match="2147483648 is greater than the maximum") as excinfo:
+        src.inputdto.decode(json.dumps(d))
+    assert excinfo.value.json_path == "$.monsters[0].x"
+
+    # initiative bounds are enforced by the schema, before the
+    # initiative/initiative2 ordering is checked
+    d = _simple_valid_json_dict()
+    d["characters"][0]["initiative"] = 0
+    with pytest.raises(
+            jsonschema.ValidationError,
+            match="0 is less than the minimum of 1") as excinfo:
+        src.inputdto.decode(json.dumps(d))
+    assert excinfo.value.json_path == "$.characters[0].initiative"
+
+    d = _simple_valid_json_dict()
+    d["characters"][0]["initiative"] = 101
+    d["characters"][0]["initiative2"] = 101
+    with pytest.raises(
+            jsonschema.ValidationError,
+            match="101 is greater than the maximum of 100") as excinfo:
+        src.inputdto.decode(json.dumps(d))
+    assert excinfo.value.json_path == "$.characters[0].initiative"
+
     d = _simple_valid_json_dict()
     d["characters"][0]["initiative"] = 100
     with pytest.raises(
@@ -187,6 +232,43 @@ def test_input_failures() -> None:
             match="two objects occupy the same hex"):
         src.inputdto.decode(json.dumps(d))
 
+    # two characters occupy same hex
+    d = _simple_valid_json_dict()
+    d["characters"].append({
+        "name": "brute",
+        "initiative": 20,
+        "initiative2": 30,
+        "x": 10,
+        "y": 10,
+    })
+    with pytest.raises(
+            ValueError,
+            match="two objects occupy the same hex"):
+        src.inputdto.decode(json.dumps(d))
+
+    # integral float coordinates are accepted as integers and collide with
+    # the equal int coordinates
+    d = _simple_valid_json_dict()
+    d['characters'][0]['x'] = 1.0
+    d['characters'][0]['y'] = 1
+    d['monsters'][0]['x'] = 1
+    d['monsters'][0]['y'] = 1.0
+    with pytest.raises(
+            ValueError,
+            match="two objects occupy the same hex"):
+        src.inputdto.decode(json.dumps(d))
+
+    # negative coordinates
+    d = _simple_valid_json_dict()
+    d['characters'][0]['x'] = -1
+    d['characters'][0]['y'] = -2
+    d['monsters'][0]['x'] = -1
+    d['monsters'][0]['y'] = -2
+    with pytest.raises(
+            ValueError,
+            match="two objects occupy the same hex"):
+        src.inputdto.decode(json.dumps(d))
+
 
 def test_str() -> None:
     d = _simple_valid_json_dict()
@@ -198,6 +280,8 @@ def test_str() -> None:
     json.loads(s)
     s = str(my_input.monsters[0])
     json.loads(s)
+    # serializing again gives the same result
+    assert str(my_input) == str(my_input)
 
 
 def test_inputs() -> None:
@@ -205,8 +289,49 @@ def test_inputs() -> None:
     d = _simple_valid_json_dict()
     my_input = src.inputdto.decode(json.dumps(d))
 
-    assert my_input._dct is not None
     assert len(my_input.characters) == 1
     assert len(my_input.monsters) == 1
     assert my_input.mm_num == 1
     assert my_input.mm_name == "living bones"
+
+    # integral float coordinates are accepted
+    d = _simple_valid_json_dict()
+    d["characters"][0]["x"] = 10.0
+    d["monsters"][0]["y"] = -15.0
+    my_input = src.inputdto.decode(json.dumps(d))
+    assert my_input.characters[0].x == 10
+    assert my_input.monsters[0].y == -15
+
+    # input may also be provided as bytes
+    my_input = src.inputdto.decode(json.dumps(d).encode())
+    assert my_input.mm_name == "living bones"
+
+
+def test_schema_data() -> None:
+    # the generated schema module is up to date with input.schema.json
+    with open(generate_schema.SCHEMA_DATA_PATH) as f:
+        assert f.read() == generate_schema.generate()
+    with open(generate_schema.SCHEMA_PATH) as f:
+        assert src._schema_data.SCHEMA == json.load(f)
+
+    # long strings are split without changing their whitespace
+    value = "a" * 40 + "\tb\n" + "c" * 60
+    assert eval(generate_schema.format_value(value, 2, 60)) == value
+
+
+def test_validator_disagreement(monkeypatch: pytest.MonkeyPatch) -> None:
+    # both validators use the draft pinned by the schema
+    assert isinstance(
+        src.inputdto._get_validator(), jsonschema.Draft7Validator)
+
+    # input rejected by fastjsonschema is never constructed, even should
+    # jsonschema find no error to report
+    class _NoErrors(object):
+        def iter_errors(self, instance: typing.Any) -> list[typing.Any]:
+            return []
+
+    monkeypatch.setattr(src.inputdto, "_get_validator", _NoErrors)
+    d = _simple_valid_json_dict()
+    d["mm_num"] = "asdf"
+    with pytest.raises(jsonschema.ValidationError, match="mm_num"):
+        src.inputdto.decode(json.dumps(d))